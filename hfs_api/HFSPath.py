@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HFSPath:
 	"""
 	Represents a file or folder on the server with HFS running.
@@ -24,4 +24,11 @@ class HFSPath:
 	comment: str = ""
 
 	def __str__(self):
-		return f"HFSPath {'folder' if self.is_directory else 'file'} \"{self.path}/{self.name}\", {f'size={self.size}, ' if not self.is_directory else ''}modified_at=<{self.modified_at}> {f'({self.comment})' if self.comment else ''} "
+		return "HFSPath %s \"%s/%s\", %smodified_at=<%s> %s " % (
+			'folder' if self.is_directory else 'file',
+			self.path,
+			self.name,
+			'' if self.is_directory else 'size=%s, ' % self.size,
+			self.modified_at,
+			'(%s)' % self.comment if self.comment else '',
+		)
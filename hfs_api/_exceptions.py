@@ -8,3 +8,7 @@ class AuthorizationFailed(APIError):
 
 class NotExistsError(APIError):
 	pass
+
+
+class AlreadyExistsError(APIError):
+	pass
@@ -5,23 +5,52 @@ __all__ = ["_local_walk_gen", "_local_walk"]
 
 def _local_walk_gen(path: str, include_dirs: bool = False):
 	"""
-	Generator function that yields full paths of all files and directories in the specified path.
+	Generator function that yields full paths of all files and directories in the specified path, along with their paths relative to it and their `os.DirEntry`.
+	Unlike `os.walk`, the entries are kept, so callers can use their cached stat data instead of stat'ing each path again.
 
 	:param path: The root directory to start the walk from.
 	:param include_dirs: If True, also yield the directories. Default is False.
-	:return: A generator that yields full paths of all files and directories in the specified path.
+	:return: A generator that yields `(full_path, relative_path, entry)` tuples for all files and directories in the specified path.
 	"""
-	for root, dirs, files in os.walk(path):
-		for file in files:
-			full_path = os.path.join(root, file)
-			yield os.path.normpath(full_path).replace(os.sep, '/')
-
-		if include_dirs:
-			for dir in dirs:
-				yield os.path.normpath(os.path.join(root, dir)).replace(os.sep, '/')
+	root = os.path.normpath(path).replace(os.sep, '/')
+	prefix = '' if root == '.' else root.rstrip('/') + '/'
+	prefix_len = len(prefix)
+
+	try:
+		stack = [(os.scandir(path), prefix)]
+	except OSError:  # same as `os.walk`, unreadable directories are skipped
+		return
+
+	try:
+		while stack:
+			it, prefix = stack[-1]
+
+			for entry in it:
+				full_path = prefix + entry.name
+
+				if not entry.is_dir():
+					yield full_path, full_path[prefix_len:], entry
+					continue
+
+				if include_dirs:
+					yield full_path, full_path[prefix_len:], entry
+
+				# same as `os.walk`, symlinks to directories are listed but not followed
+				if entry.is_symlink():
+					continue
+
+				try:
+					stack.append((os.scandir(entry.path), full_path + '/'))
+				except OSError:
+					continue
+				break
+			else:
+				stack.pop()
+				it.close()
+	finally:
+		for it, _ in stack:
+			it.close()
 
 
 def _local_walk(path: str, include_dirs: bool = False):
-	res = [i for i in _local_walk_gen(path, include_dirs)]
-
-	return res
+	return [full_path for full_path, _, _ in _local_walk_gen(path, include_dirs)]
@@ -1,19 +1,216 @@
-from typing import Literal
+from typing import Iterable, Iterator, Literal
+from types import MappingProxyType
 import os
+import posixpath
 import json
+import functools
+import contextlib
+import io
+import urllib.parse
+import logging
+import mmap
 import requests
-from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from http.cookiejar import DefaultCookiePolicy
 from datetime import datetime
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
+try:
+	import orjson
+except ImportError:  # orjson is optional, the standard library is used without it
+	orjson = None
+
+# aiohttp and httpx are optional and slow to import, so they are imported by the methods that need them instead of here
+
+try:
+	from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:  # ciso8601 is optional, it parses listing timestamps much faster than the standard library
+	_parse_datetime = datetime.fromisoformat
+
 from ._exceptions import *
 from ._constants import *
+from .HFSPath import HFSPath
 from .output import colorize_status_code
-from ._file_walk import *
+from ._file_walk import _local_walk_gen
 
 __all__ = ["HFS"]
 
+logger = logging.getLogger(__name__)
+
+_JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+if orjson is not None:
+	_dumps = orjson.dumps
+	_loads = orjson.loads
+else:
+	def _dumps(obj) -> bytes:
+		return json.dumps(obj).encode()
+
+	_loads = json.loads
+
+
+def _dir_key(path: str) -> str:
+	"""
+	Normalizes a remote path into the form used as a listing cache key, e.g. "a/b/" -> "/a/b".
+	"""
+	return '/' + path.strip('/')
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote(path: str) -> str:
+	"""
+	Percent-encodes a remote path for use in a URL, so names with spaces, '#', '?', '&' or non-ASCII characters survive, e.g. "/a b/#1" -> "/a%20b/%231".
+	"""
+	return urllib.parse.quote(path, safe='/')
+
+
+class _Session(requests.Session):
+	"""
+	Session that carries its cookies as a plain `Cookie` header. Cookies passed to a single request replace that header
+	(requests would otherwise skip them, since the header is already set).
+	"""
+
+	def prepare_request(self, request: requests.Request) -> requests.PreparedRequest:
+		if request.cookies:
+			request.headers = {**(request.headers or {}), "Cookie": None}  # `None` drops the session header
+
+		return super().prepare_request(request)
+
+	def rebuild_auth(self, prepared_request: requests.PreparedRequest, response: requests.Response):
+		super().rebuild_auth(prepared_request, response)
+
+		# redirects rebuild the `Cookie` header from the jar, which never holds the session cookies,
+		# so the session header is put back unless the redirect leaves the host
+		if (
+				"Cookie" not in prepared_request.headers
+				and "Cookie" in self.headers
+				and not self.should_strip_auth(response.request.url, prepared_request.url)
+		):
+			prepared_request.headers["Cookie"] = self.headers["Cookie"]
+
+
+class _UploadAdapter(HTTPAdapter):
+	"""
+	Adapter whose connections send file bodies in 1 MB blocks instead of urllib3's default 16 KB ones.
+	Large uploads then take far fewer `read` and TLS `send` calls, and their progress bar far fewer updates.
+	"""
+
+	blocksize = 1 << 20
+
+	def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+		super().init_poolmanager(connections, maxsize, block=block, blocksize=self.blocksize, **pool_kwargs)
+
+
+class _EventDataReader:
+	"""
+	Read-only file view of the first `data:` line of an event-stream body, so its JSON can be parsed while it is still downloading.
+	"""
+
+	def __init__(self, chunks: Iterator[bytes]):
+		self._chunks = chunks
+		self._buffer = b""
+		self._started = False  # the `data: ` prefix is stripped
+		self._done = False  # the end of the line is reached
+
+	def read(self, n: int = -1) -> bytes:
+		while not self._done and (not self._started or n < 0 or len(self._buffer) < n):
+			chunk = next(self._chunks, None)
+			if chunk is None:
+				self._done = True
+				break
+
+			end = chunk.find(b"\n")
+			if end != -1:
+				chunk = chunk[:end]
+				self._done = True
+
+			self._buffer += chunk
+			if not self._started and (len(self._buffer) >= len(b"data: ") or self._done):
+				self._buffer = self._buffer.removeprefix(b"data: ")
+				self._started = True
+
+		if n < 0:
+			n = len(self._buffer)
+
+		data, self._buffer = self._buffer[:n], self._buffer[n:]
+		return data
+
+
+class _ProgressFile:
+	"""
+	Read-only file proxy that reports every read to a `tqdm` progress bar, so the file can be streamed as a raw request body.
+	"""
+
+	def __init__(self, f, size: int, bar: tqdm):
+		self._f = f
+		self._size = size
+		self._bar = bar
+
+	def __len__(self):
+		# lets `requests` send a `Content-Length` instead of a chunked body
+		return self._size
+
+	def read(self, n: int = -1) -> bytes:
+		chunk = self._f.read(n)
+		self._bar.update(len(chunk))
+		return chunk
+
+	# `tell` and `seek` let urllib3 rewind the body when a request is retried
+	def tell(self) -> int:
+		return self._f.tell()
+
+	def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+		position = self._f.seek(offset, whence)
+		self._bar.update(position - self._bar.n)
+		return position
+
+
+class _MultipartBody:
+	"""
+	`multipart/form-data` body of a single file field that reports every read to a `tqdm` progress bar.
+	Unlike a bare `MultipartEncoderMonitor`, it can be rewound, so urllib3 can resend it when a request is retried.
+	"""
+
+	def __init__(self, f, bar: tqdm):
+		from requests_toolbelt import MultipartEncoder  # only needed for multipart uploads
+
+		self._f = f
+		self._bar = bar
+		self._boundary = MultipartEncoder(fields={}).boundary_value  # kept across rewinds, so the length doesn't change
+		self._rewind()
+
+	def _rewind(self):
+		from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+
+		self._f.seek(0)
+		self._bar.reset()
+		# thx Glen Thompson (https://stackoverflow.com/a/67726532/16815310)
+		self._monitor = MultipartEncoderMonitor(
+			MultipartEncoder(fields={"file": ("filename", self._f)}, boundary=self._boundary),
+			lambda monitor: self._bar.update(monitor.bytes_read - self._bar.n)
+		)
+
+	def __len__(self):
+		return self._monitor.len
+
+	def read(self, n: int = -1) -> bytes:
+		return self._monitor.read(n)
+
+	# `tell` and `seek` let urllib3 rewind the body when a request is retried
+	def tell(self) -> int:
+		return self._monitor.bytes_read
+
+	def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+		if offset != 0 or whence != os.SEEK_SET:
+			raise io.UnsupportedOperation("multipart body can only be rewound to its start")
+
+		self._rewind()
+		return 0
+
 
 class HFS:
 	"""
@@ -21,10 +218,11 @@ class HFS:
 
 	Attributes:
 		domain (str): The domain of the HFS server.
-		__cookies (dict): The cookies used for authentication.
+		_session (requests.Session): The pooled session used for all requests; it also carries the cookies used for authentication as a `Cookie` header.
+		_http2_client (httpx.Client | None): The HTTP/2 client used for JSON API calls if `http2=True` was passed, None otherwise.
 
 	Methods:
-		- __init__(domain: str): Initializes an instance of the HFS server.
+		- __init__(domain: str, *, http2: bool = False): Initializes an instance of the HFS server.
 		- authorize(login: str, password: str) -> requests.Response: Authenticates the user by sending a login request to the server.
 		- get_cookies() -> dict: Returns the cookies used for authentication.
 		- set_cookies(cookies: dict): Sets the cookies used for authentication.
@@ -32,14 +230,88 @@ class HFS:
 		- delete(path: str, force: bool = False, cookies: dict | requests.cookies.RequestsCookieJar = None) -> requests.Response: Deletes a file or folder on the server with HFS running.
 		- upload_file(local_path: str, remote_path: str = "", exists: Literal[UploadMode.OVERWRITE.value, UploadMode.SKIP.value] = UploadMode.SKIP.value, cookies: dict | requests.cookies.RequestsCookieJar = None) -> requests.Response: Uploads a file from the local system to the server with HFS running.
 		- list(path: str = "/", cookies: dict | requests.cookies.RequestsCookieJar = None) -> List[HFSPath]: Lists all files and folders in the specified path on the server with HFS running.
+		- list_iter(path: str = "/", cookies: dict | requests.cookies.RequestsCookieJar = None) -> Iterator[HFSPath]: Yields the files and folders in the specified path while the listing is still downloading.
+		- list_bulk(path: str = "/", cookies: dict | requests.cookies.RequestsCookieJar = None) -> pyarrow.Table: Lists all files and folders in the specified path as a columnar table.
 		- exists(path: str, cookies: dict | requests.cookies.RequestsCookieJar = None) -> bool: Checks if a file or folder exists in the specified path on the server with HFS running.
+		- exists_many(paths: Iterable[str], cookies: dict | requests.cookies.RequestsCookieJar = None) -> dict[str, bool]: Checks if each of the specified files or folders exists on the server with HFS running, using a single request.
 		- create_folders(path: str, *, root: str = "/", cookies: dict | requests.cookies.RequestsCookieJar = None) -> None: Creates multiple folders in the specified path on the server with HFS running.
+		- upload_file_parallel(local_path: str, remote_root: str = "", *, part_size: int = 8 << 20, max_workers: int = 8, cookies: dict | requests.cookies.RequestsCookieJar = None) -> tuple[requests.Response, ...]: Uploads a large file in parts sent concurrently as ranged PUT requests.
 		- upload_folder(local_path: str, remote_path: str = "/", cookies: dict | requests.cookies.RequestsCookieJar = None) -> None: Uploads a folder from the local system to the server with HFS running.
 	"""
 
-	def __init__(self, domain):
+	def __init__(self, domain, *, http2: bool = False):
+		"""
+		:param domain: The domain of the HFS server.
+		:param http2: If True, JSON API calls (folder creation, deletion, renaming, moving and existence checks) are multiplexed
+		    over a single HTTP/2 connection with `httpx`, and return `httpx.Response` objects. Requires `httpx[http2]`. Default is False.
+		"""
 		self.domain = domain
-		self.__cookies = requests.cookies.RequestsCookieJar()
+
+		# urls are built once, not on every call
+		base = f"https://{self.domain}"
+		self._urls = {
+			"root": base,
+			"create_folder": f"{base}/~/api/create_folder",
+			"delete": f"{base}/~/api/delete",
+			"rename": f"{base}/~/api/rename",
+			"get_file_list": f"{base}/~/api/get_file_list",
+			"get_file_details": f"{base}/~/api/get_file_details",
+			"move_files": f"{base}/~/api/move_files",
+		}
+
+		# keep-alive connections are reused across calls, so TCP and TLS handshakes are paid once per connection
+		self._session = _Session()
+		# transient gateway errors and connection failures of idempotent requests are retried with backoff, honoring `Retry-After`.
+		# 500 is not retried, HFS answers it for errors that won't go away, e.g. deleting a missing file.
+		# once retries run out, the last response is returned rather than raising `RetryError`, so callers still see its status code
+		retry = Retry(
+			total=5,
+			backoff_factor=0.5,
+			status_forcelist=[502, 503, 504],
+			allowed_methods=frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}),
+			respect_retry_after_header=True,
+			raise_on_status=False,
+		)
+		self._session.mount("https://", _UploadAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry))
+		self._session.headers["X-Hfs-Anti-Csrf"] = "1"
+		self._session.headers["Connection"] = "keep-alive"  # requests' default, set explicitly since pooling relies on it
+
+		self._http2_client = None
+		if http2:
+			try:
+				import httpx
+				import h2  # noqa, only checks that httpx can speak HTTP/2
+			except ImportError:
+				raise ImportError("\"http2\" param requires httpx[http2] to be installed") from None
+
+			self._http2_client = httpx.Client(
+				# JSON API calls are POSTs, so only failed connection attempts are retried, the requests themselves are not
+				transport=httpx.HTTPTransport(
+					http2=True,
+					limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+					retries=3,
+				),
+				headers={"X-Hfs-Anti-Csrf": "1"},
+				timeout=30,
+				event_hooks={"response": [self._store_cookies]},
+			)
+
+		# cookies are sent as a ready-made `Cookie` header instead of a jar, so requests doesn't merge and serialize a jar on every call.
+		# the session jar rejects everything, cookies set by the server are collected by the response hook instead
+		self._cookies: dict[str, str] = {}
+		self._cookies_lock = threading.Lock()
+		self._session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+		self._session.hooks["response"].append(self._store_cookies)
+
+		# short-lived cache of `list()` results, so batches of listings and existence checks don't refetch the same folder
+		self._list_cache: dict[tuple, tuple[float, list[HFSPath]]] = {}
+		self._list_cache_lock = threading.Lock()
+		self.list_cache_ttl = 2.0
+		self.list_cache_maxsize = 512
+
+		# folders seen to exist (created, listed or checked), so creating nested folders skips them without asking the server
+		self._known_dirs: set[str] = set()
+		self._known_dirs_lock = threading.Lock()
 
 	def __str__(self):
 		return f"HFS instance at {self.domain}"
@@ -58,14 +330,15 @@ class HFS:
 	    - AuthorizationFailed: If the HTTP status code is not 200 or 302.
 	    """
 
-		url = f"https://{self.domain}/?login={login}:{password}"
+		url = f"{self._urls['root']}/?login={login}:{password}"
 
-		response = requests.get(url)
+		response = self._session.get(url)
 
 		if response.status_code not in (200, 302):  # 200 OK, 302 Found
 			raise AuthorizationFailed(f"HTTP status code {response.status_code}")
 
-		self.__cookies = response.cookies
+		self.invalidate_path()
+		self.invalidate_dir_cache()
 
 		return response
 
@@ -75,19 +348,125 @@ class HFS:
 
 		:returns: A dictionary containing the cookies.
 	    """
-		return self.__cookies.get_dict()
+		with self._cookies_lock:
+			return self._cookies.copy()
 
-	def set_cookies(self, cookies: dict):
+	def set_cookies(self, cookies: dict | requests.cookies.RequestsCookieJar):
 		"""
 		Sets the cookies used for authentication.
 
-		:param cookies: The cookies to use for authentication. If not provided, the instance's cookies will be used.
+		:param cookies: The cookies to use for authentication, replacing the instance's cookies.
 
 	    :returns: None
+
+	    Raises:
+
+	    - TypeError: If 'cookies' is not a dict or a `RequestsCookieJar`.
 	    """
-		assert isinstance(cookies, dict)
+		# a real check instead of `assert`, which `python -O` strips
+		if not isinstance(cookies, (dict, requests.cookies.RequestsCookieJar)):
+			raise TypeError(f"\"cookies\" param should be a dict or a RequestsCookieJar, not {type(cookies).__name__}")
+
+		with self._cookies_lock:
+			self._cookies = dict(cookies.items())
+			self._update_cookie_header()
+		self.invalidate_path()
+		self.invalidate_dir_cache()
+
+	def _store_cookies(self, response: "requests.Response | httpx.Response", **kwargs):
+		if not response.cookies:
+			return
+
+		# a call with one-off `cookies=` belongs to another login, its Set-Cookie must not replace the session's own
+		client = self._session if isinstance(response, requests.Response) else self._http2_client
+		if response.request.headers.get("Cookie") != client.headers.get("Cookie"):
+			return
+
+		with self._cookies_lock:
+			self._cookies.update(response.cookies.items())
+			self._update_cookie_header()
+
+	def _update_cookie_header(self):
+		# callers hold `_cookies_lock`
+		for headers in (self._session.headers, self._http2_client.headers if self._http2_client is not None else {}):
+			if self._cookies:
+				headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in self._cookies.items())
+			else:
+				headers.pop("Cookie", None)
+
+	def _post_json(self,
+	               url: str,
+	               payload: dict,
+	               *,
+	               cookies: dict | requests.cookies.RequestsCookieJar = None) -> "requests.Response | httpx.Response":
+		if self._http2_client is None:
+			return self._session.post(
+				url,
+				headers=_JSON_HEADERS,
+				cookies=cookies,
+				data=_dumps(payload)
+			)
+
+		headers = _JSON_HEADERS
+		if cookies is not None:  # httpx deprecated per-request cookies, so they replace the client's `Cookie` header
+			headers = {**headers, "Cookie": "; ".join(f"{name}={value}" for name, value in dict(cookies).items())}
+
+		return self._http2_client.post(url, headers=headers, content=_dumps(payload))
+
+	def invalidate_path(self, path: str = None):
+		"""
+		Evicts cached listings affected by a change of the specified path: the listing of the path itself and of its parent folder.
 
-		self.__cookies = cookies
+		:param path: The path of the changed file or folder. If not provided, the whole cache is cleared.
+
+		:returns: None
+		"""
+		with self._list_cache_lock:
+			if path is None:
+				self._list_cache.clear()
+				return
+
+			path = _dir_key(path)
+			stale = {path, _dir_key(path.rsplit('/', 1)[0])}
+			for key in [key for key in self._list_cache if key[0] in stale]:
+				del self._list_cache[key]
+
+	def invalidate_dir_cache(self, path: str = None):
+		"""
+		Forgets that the specified folder and all folders inside it exist, e.g. after changing the server out-of-band.
+
+		:param path: The path of the folder. If not provided, all known folders are forgotten.
+
+		:returns: None
+		"""
+		with self._known_dirs_lock:
+			if path is None:
+				self._known_dirs.clear()
+				return
+
+			path = _dir_key(path)
+			self._known_dirs.difference_update([known for known in self._known_dirs if known == path or known.startswith(path + '/')])
+
+	def _remember_dirs(self, paths: Iterable[str]):
+		with self._known_dirs_lock:
+			self._known_dirs.update(_dir_key(path) for path in paths)
+
+	def _list_cache_key(self, path: str, cookies: dict | requests.cookies.RequestsCookieJar | None) -> tuple:
+		# `None` stands for the session cookies, which clear the cache whenever they change
+		return _dir_key(path), None if cookies is None else frozenset(dict(cookies).items())
+
+	def _cached_list(self, key: tuple) -> list[HFSPath] | None:
+		with self._list_cache_lock:
+			entry = self._list_cache.get(key)
+			if entry is None:
+				return None
+
+			stored_at, files_obj = entry
+			if time.monotonic() - stored_at > self.list_cache_ttl:
+				del self._list_cache[key]
+				return None
+
+			return files_obj
 
 	def _create_folder_one(self,
 	                       folder_name: str,
@@ -109,23 +488,14 @@ class HFS:
 	    - AuthorizationFailed: If the HTTP status code is not 200 or 302.
 	    - NotExistsError: If the parent folder does not exist.
 	    """
-		if cookies is None:
-			cookies = self.__cookies
-
-		url = f"https://{self.domain}/~/api/create_folder"
+		url = self._urls["create_folder"]
 
-		headers = {"X-Hfs-Anti-Csrf": "1"}
 		payload = {
 			"uri": root,
 			"name": folder_name
 		}
 
-		response = requests.post(
-			url,
-			headers=headers,
-			cookies=cookies,
-			data=json.dumps(payload)
-		)
+		response = self._post_json(url, payload, cookies=cookies)
 
 		match response.status_code:
 			case 401:  # 401 Unauthorized
@@ -136,6 +506,11 @@ class HFS:
 			case 409:  # 409 Conflict
 				raise AlreadyExistsError(f"folder \"{folder_name}\" already exists")
 		"""
+		self.invalidate_path(f"{root.rstrip('/')}/{folder_name}")
+
+		if 200 <= response.status_code < 300 or response.status_code == 409:  # 409 Conflict, the folder already exists
+			self._remember_dirs([f"{root.rstrip('/')}/{folder_name}"])
+
 		return response
 
 	def create_folder(self,
@@ -155,11 +530,27 @@ class HFS:
 		- AuthorizationFailed: If the HTTP status code is not 200 or 302.
 		- NotExistsError: If the parent folder does not exist.
 		"""
-		components = os.path.normpath(folder_name).split(os.sep)
+		# empty components come from absolute paths, e.g. "/a/b"
+		components = [name for name in posixpath.normpath(folder_name.replace(os.sep, '/')).split('/') if name]
+
+		# `(parent, name, path)` of every level, each path is built from its parent's instead of joining all components again
+		levels = []
+		parent = "/"
+		for name in components:
+			path = posixpath.join(parent, name)
+			levels.append((parent, name, path))
+			parent = path
+
+		# one request tells which of the levels not known yet already exist, only the missing ones are created
+		existing = self.exists_many([path for _, _, path in levels if path not in self._known_dirs], cookies=cookies)
+		self._remember_dirs(path for path, exists in existing.items() if exists)
 
-		for i, name in enumerate(components):
-			resp = self._create_folder_one(name, root=os.path.join('/', *components[:i]).replace(os.sep, '/'), cookies=cookies)
-			print(colorize_status_code(resp.status_code), resp.text)
+		for parent, name, path in levels:
+			if existing.get(path, True):  # known folders are not in `existing`
+				continue
+
+			resp = self._create_folder_one(name, root=parent, cookies=cookies)
+			logger.debug("create folder %s: %s %s", path, resp.status_code, resp.text)
 
 	def delete(self,
 	           path: str,
@@ -181,27 +572,18 @@ class HFS:
 		- AuthorizationFailed: If the HTTP status code is not 200 or 302.
 		- NotExistsError: If the specified path does not exist.
 		"""
-		if cookies is None:
-			cookies = self.__cookies
-
 		if not force and path == "/":
 			input(f"are you sure you want to delete \"{path}\"? (y/[n])")
 			if input().lower() not in {"y", "yes"}:
 				return None
 
-		url = f"https://{self.domain}/~/api/delete"
+		url = self._urls["delete"]
 
-		headers = {"X-Hfs-Anti-Csrf": "1"}
 		payload = {
 			"uri": path,
 		}
 
-		response = requests.post(
-			url,
-			headers=headers,
-			cookies=cookies,
-			data=json.dumps(payload)
-		)
+		response = self._post_json(url, payload, cookies=cookies)
 
 		match response.status_code:
 			case 401:  # 401 Unauthorized
@@ -209,6 +591,9 @@ class HFS:
 			case 500:  # 500 Internal Server Error
 				raise NotExistsError(f"path \"{path}\" does not exist")
 
+		self.invalidate_path(path)
+		self.invalidate_dir_cache(path)
+
 		return response
 
 	def rename(self,
@@ -232,23 +617,14 @@ class HFS:
         - NotExistsError: If the specified 'old_name' does not exist on the server.
         - IsADirectoryError: If the specified 'new_name' is a directory.
         """
-		if cookies is None:
-			cookies = self.__cookies
+		url = self._urls["rename"]
 
-		url = f"https://{self.domain}/~/api/rename"
-
-		headers = {"X-Hfs-Anti-Csrf": "1"}
 		payload = {
 			"uri": old_name,
 			"dest": new_name
 		}
 
-		response = requests.post(
-			url,
-			headers=headers,
-			cookies=cookies,
-			data=json.dumps(payload)
-		)
+		response = self._post_json(url, payload, cookies=cookies)
 
 		"""
 		match response.status_code:
@@ -260,6 +636,9 @@ class HFS:
 				raise IsADirectoryError(f"path \"{new_name}\" is a directory")
 		"""
 
+		self.invalidate_path(old_name)
+		self.invalidate_dir_cache(old_name)
+
 		return response
 
 	def list(self,
@@ -280,39 +659,154 @@ class HFS:
 		- APIError: If the server returns an error response.
 		"""
 
-		if cookies is None:
-			cookies = self.__cookies
+		cache_key = self._list_cache_key(path, cookies)
+		cached = self._cached_list(cache_key)
+		if cached is not None:
+			return cached.copy()
 
-		url = f"https://{self.domain}/~/api/get_file_list?uri={path}"
+		files_obj = [*self._to_hfs_paths(self._fetch_list(path, cookies=cookies), path)]
 
-		response = requests.get(
-			url,
-			cookies=cookies,
-		)
-		if response.status_code != 200:
-			raise APIError(f"HTTP status code {response.status_code}")
-
-		response_text: str = response.text.split('\n')[0].removeprefix("data: ")
-		json_response: dict = json.loads(response_text)
-
-		# example: {'can_archive': True, 'can_upload': False, 'can_delete': False, 'can_overwrite': False, 'can_comment': False}
-		permissions = {key: value for key, value in json_response.items() if key != "list"}
-		files = json_response["list"]
-		files_obj = []
-
-		for i in range(len(files)):
-			if files[i].get('n', None) is not None:
-				files_obj.append(HFSPath(
-					name=files[i]['n'],
-					size=files[i].get('s', 0),
-					modified_at=datetime.fromisoformat(files[i]['m']),
-					path=path,
-					is_directory=files[i]['n'].endswith('/'),
-					comment=files[i].get('c', "")
-				))
+		with self._list_cache_lock:
+			if len(self._list_cache) >= self.list_cache_maxsize:
+				del self._list_cache[next(iter(self._list_cache))]  # the oldest entry
+			self._list_cache[cache_key] = (time.monotonic(), files_obj.copy())
 
 		return files_obj
 
+	def list_iter(self,
+	              path: str = "/",
+	              *,
+	              cookies: dict | requests.cookies.RequestsCookieJar = None) -> Iterator[HFSPath]:
+
+		"""
+		Yields the files and folders in the specified path on the server with HFS running, as the listing downloads.
+		With `ijson` installed, the listing is parsed incrementally, so the first entries are available before the whole
+		listing is received and large listings are never held in memory at once. Without it, the listing is fetched with `list`.
+		Results are not cached, since the generator may be abandoned before the end.
+
+		:param path: The path of the directory to list files and folders from. Default is "/" (root directory).
+		:param cookies: The cookies to use for authentication. If not provided, the instance's cookies will be used.
+
+		:returns: A generator of `HFSPath` objects representing the files and folders in the specified path.
+
+		Raises:
+
+		- APIError: If the server returns an error response.
+		"""
+		try:
+			import ijson
+		except ImportError:  # ijson is optional, the whole listing is parsed at once without it
+			yield from self.list(path, cookies=cookies)
+			return
+
+		url = f"{self._urls['get_file_list']}?uri={_quote(path)}"
+
+		with self._session.get(
+				url,
+				cookies=cookies,
+				stream=True,
+		) as response:
+			if response.status_code != 200:
+				raise APIError(f"HTTP status code {response.status_code}")
+
+			chunks = response.iter_content(chunk_size=64 * 1024)
+			files = (file for file in ijson.items(_EventDataReader(chunks), "list.item") if 'n' in file)
+			yield from self._to_hfs_paths(files, path)
+
+			# the rest of the stream is drained, so the connection goes back to the pool instead of being dropped
+			for _ in chunks:
+				pass
+
+	def _to_hfs_paths(self, files: Iterable[dict], path: str) -> Iterator[HFSPath]:
+		# bulk-copied files often share a timestamp, so each distinct one is parsed once
+		timestamps = {}
+		directories = [path]
+		for file in files:
+			modified_at = timestamps.get(raw := file['m'])
+			if modified_at is None:
+				modified_at = timestamps[raw] = _parse_datetime(raw)
+
+			hfs_path = HFSPath(
+				name=(name := file['n']),
+				size=file.get('s', 0),
+				modified_at=modified_at,
+				path=path,
+				is_directory=name.endswith('/'),
+				comment=file.get('c', "")
+			)
+			if hfs_path.is_directory:
+				directories.append(f"{_dir_key(path)}/{name}")
+
+			yield hfs_path
+
+		# the listed folder and its subfolders exist
+		self._remember_dirs(directories)
+
+	def list_bulk(self,
+	              path: str = "/",
+	              *,
+	              cookies: dict | requests.cookies.RequestsCookieJar = None) -> "pyarrow.Table":
+
+		"""
+		Lists all files and folders in the specified path as a columnar `pyarrow.Table`, without building an `HFSPath` per entry.
+		Suited for large folders, which can then be filtered and sorted with `pyarrow.compute`. Requires `pyarrow`.
+
+		:param path: The path of the directory to list files and folders from. Default is "/" (root directory).
+		:param cookies: The cookies to use for authentication. If not provided, the instance's cookies will be used.
+
+		:returns: A table with `name`, `size`, `modified_at`, `is_directory` and `comment` columns, one row per file or folder.
+
+		Raises:
+
+		- APIError: If the server returns an error response.
+		- ImportError: If `pyarrow` is not installed.
+		"""
+		try:
+			import pyarrow
+		except ImportError:
+			raise ImportError("\"list_bulk\" requires pyarrow to be installed") from None
+
+		files = self._fetch_list(path, cookies=cookies)
+
+		names = [file['n'] for file in files]
+		timestamps = {raw: _parse_datetime(raw) for raw in {file['m'] for file in files}}
+
+		return pyarrow.table({
+			"name": pyarrow.array(names, type=pyarrow.string()),
+			"size": pyarrow.array([file.get('s', 0) for file in files], type=pyarrow.int64()),
+			"modified_at": pyarrow.array([timestamps[file['m']] for file in files], type=pyarrow.timestamp("us", tz="UTC")),
+			"is_directory": pyarrow.array([name.endswith('/') for name in names], type=pyarrow.bool_()),
+			"comment": pyarrow.array([file.get('c', "") for file in files], type=pyarrow.string()),
+		})
+
+	def _fetch_list(self, path: str, *, cookies: dict | requests.cookies.RequestsCookieJar = None) -> "list[dict]":
+		"""
+		Requests the listing of `path` and returns its raw entries, e.g. `{'n': "a.txt", 's': 3, 'm': "2024-01-02T10:00:00.000Z"}`.
+		"""
+		url = f"{self._urls['get_file_list']}?uri={_quote(path)}"
+
+		# the body is an event stream and the listing is its first `data:` line, so only that line is read
+		with self._session.get(
+				url,
+				cookies=cookies,
+				stream=True,
+		) as response:
+			if response.status_code != 200:
+				raise APIError(f"HTTP status code {response.status_code}")
+
+			lines = response.iter_lines(chunk_size=64 * 1024)
+			response_line: bytes = next(lines, b"").removeprefix(b"data: ")
+
+			# the rest of the stream is drained, so the connection goes back to the pool instead of being dropped.
+			# it is read through the same iterator, a new one would leave the connection unreleased
+			for _ in lines:
+				pass
+
+		json_response: dict = _loads(response_line)
+
+		# besides "list", the response carries permissions, e.g. {'can_archive': True, 'can_upload': False, 'can_delete': False}
+		return [file for file in json_response["list"] if file.get('n') is not None]
+
 	def exists(self,
 	           path: str,
 	           *,
@@ -331,26 +825,56 @@ class HFS:
 		- APIError: If the server returns an error response.
 		"""
 
-		if cookies is None:
-			cookies = self.__cookies
+		return self.exists_many([path], cookies=cookies)[path]
+
+	def exists_many(self,
+	                paths: Iterable[str],
+	                *,
+	                cookies: dict | requests.cookies.RequestsCookieJar = None) -> dict[str, bool]:
+
+		"""
+		Checks if each of the specified files or folders exists on the server with HFS running, using a single request.
+
+		:param paths: The paths to check for existence.
+		:param cookies: The cookies to use for authentication. If not provided, the instance's cookies will be used.
+
+		:returns: A dictionary mapping each of the specified paths to whether it exists on the server.
+
+		Raises:
+
+		- APIError: If the server returns an error response.
+		"""
+
+		results: dict[str, bool] = {}
+		unknown = []
 
-		url = f"https://{self.domain}/~/api/get_file_details"
+		for path in dict.fromkeys(paths):
+			# a fresh listing of the parent folder answers the question without a round-trip
+			parent, _, name = _dir_key(path).rpartition('/')
+			listing = self._cached_list(self._list_cache_key(parent, cookies)) if name else None
+
+			if listing is None:
+				unknown.append(path)
+			else:
+				results[path] = any(hfs_path.name.rstrip('/') == name for hfs_path in listing)
+
+		if not unknown:
+			return results
+
+		url = self._urls["get_file_details"]
 
-		headers = {"X-Hfs-Anti-Csrf": "1"}
 		payload = {
-			"uris": [path]
+			"uris": unknown
 		}
 
-		response = requests.post(
-			url,
-			headers=headers,
-			cookies=cookies,
-			data=json.dumps(payload)
-		)
+		response = self._post_json(url, payload, cookies=cookies)
+
+		json_response = _loads(response.content)
 
-		json_response = json.loads(response.text)
+		for path, details in zip(unknown, json_response["details"]):
+			results[path] = details != False  # noqa, don't reformat, `details` may be None, False or non-null object
 
-		return json_response["details"][0] != False  # noqa, don't reformat, `json_response["details"][0]` may be None, False or non-null object
+		return results
 
 	def move(self,
 	         old_path: str,
@@ -374,26 +898,16 @@ class HFS:
 		- IsADirectoryError: If the specified 'new_path' is a directory.
 		"""
 
-		if cookies is None:
-			cookies = self.__cookies
+		url = self._urls["move_files"]
 
-		url = f"https://{self.domain}/~/api/move_files"
-
-		headers = {"X-Hfs-Anti-Csrf": "1"}
 		payload = {
 			"uri_from": [old_path],
 			"uri_to": new_path
 		}
 
-		print(payload)
-		print(json.dumps(payload))
+		logger.debug("move payload: %s", payload)
 
-		response = requests.post(
-			url,
-			headers=headers,
-			cookies=cookies,
-			data=json.dumps(payload)
-		)
+		response = self._post_json(url, payload, cookies=cookies)
 
 		"""
 		match response.status_code:
@@ -405,13 +919,23 @@ class HFS:
 				raise IsADirectoryError(f"path \"{new_name}\" is a directory")
 		"""
 
+		self.invalidate_path(old_path)
+		self.invalidate_path(new_path)
+		self.invalidate_dir_cache(old_path)
+
 		return response
 
+	def _upload_url(self, local_path: str, remote_root: str, exists: str) -> str:
+		remote_file = posixpath.join('/', remote_root.replace(os.sep, '/').strip('/'), os.path.basename(local_path))
+		return f"{self._urls['root']}{_quote(remote_file)}?existing={exists}"
+
 	def _upload_file(self,
 	                 local_path: str,
 	                 remote_root: str = "",
 	                 *,
 	                 exists: Literal[UploadMode.OVERWRITE.value, UploadMode.SKIP.value] = UploadMode.SKIP.value,
+	                 entry: os.DirEntry = None,
+	                 multipart: bool = False,
 	                 cookies: dict | requests.cookies.RequestsCookieJar = None) -> requests.Response:
 
 		"""
@@ -420,6 +944,8 @@ class HFS:
 		:param local_path: The path of the file to be uploaded on the local system.
 		:param remote_root: The path where the file will be uploaded on the server. Default is "/" (root directory).
 		:param exists: The action to be taken if the file already exists on the server. Can be either 'UploadMode.OVERWRITE.value' or 'UploadMode.SKIP.value'. Default is 'UploadMode.SKIP.value'.
+		:param entry: The `os.DirEntry` of the file, if it is already known from a directory walk. Its cached stat data is used instead of stat'ing the file again.
+		:param multipart: If True, files larger than 1 MB are sent as `multipart/form-data` instead of a raw body, for servers that require it. Default is False.
 		:param cookies: The cookies to use for authentication. If not provided, the instance's cookies will be used.
 
 		:returns: The HTTP response from the server.
@@ -432,8 +958,98 @@ class HFS:
 		- AuthorizationFailed: If the server denies access.
 		"""
 
-		if cookies is None:
-			cookies = self.__cookies
+		if entry is None:
+			if not os.path.exists(local_path):
+				raise FileNotFoundError(f"file \"{local_path}\" does not exist")
+
+			if not os.path.isfile(local_path):
+				raise IsADirectoryError("path \"{path}\" is a directory")
+
+			file_size = os.path.getsize(local_path)
+		else:
+			file_size = entry.stat().st_size
+
+		if exists not in (UploadMode.OVERWRITE.value, UploadMode.SKIP.value):
+			raise ValueError("\"exists\" param should be 'UploadMode.OVERWRITE.value' or 'UploadMode.SKIP.value'")
+
+		# url = f"https://{self.domain}/{os.path.join(remote_root, os.path.basename(local_path)).replace(os.sep, '/')}?existing={exists}"
+
+		remote_root = remote_root.removeprefix('/')
+
+		url = self._upload_url(local_path, remote_root, exists)
+
+		file_size_threshold = 1024 * 1024  # 1 MB
+
+		# plz dont take out `response = requests.put...` of `with` block.
+		# the body is read from the file dynamically, so request should be inside `with tqdm` block.
+		# small files get no progress bar, large ones report every read to it
+		with open(local_path, 'rb') as f, (
+				tqdm(
+					desc=os.path.basename(local_path),
+					total=file_size,
+					unit="B",
+					unit_scale=True,
+					unit_divisor=1024,
+				) if file_size >= file_size_threshold else contextlib.nullcontext()
+		) as bar:
+			# large files are read front to back, so the kernel is told to read ahead further while the previous block is sent
+			if bar is not None and hasattr(os, "posix_fadvise"):
+				os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+			# the file is streamed rather than read into memory, the session's retries rewind it
+			if bar is None:
+				data = f
+			elif multipart:
+				data = _MultipartBody(f, bar)
+			else:
+				# HFS takes the raw body, so multipart framing is not needed
+				data = _ProgressFile(f, file_size, bar)
+
+			response = self._session.put(
+				url,
+				cookies=cookies,
+				data=data
+			)
+
+		match response.status_code:
+			case 401:  # 401 Unauthorized
+				raise AuthorizationFailed("Access denied")
+
+		self.invalidate_path(f"/{remote_root}/{os.path.basename(local_path)}")
+
+		return response
+
+	def upload_file_parallel(self,
+	                         local_path: str,
+	                         remote_root: str = "",
+	                         *,
+	                         exists: Literal[UploadMode.OVERWRITE.value, UploadMode.SKIP.value] = UploadMode.SKIP.value,
+	                         part_size: int = 8 << 20,
+	                         max_workers: int = 8,
+	                         cookies: dict | requests.cookies.RequestsCookieJar = None) -> tuple[requests.Response, ...]:
+
+		"""
+		Upload a large file from the local system to the server with HFS running, sending its parts concurrently as ranged PUT requests.
+		The server must accept `Content-Range` on PUT; a failed part can then be resent alone.
+		The size of the uploaded file is checked afterwards, so a server that ignores `Content-Range` is detected.
+
+		:param local_path: The path of the file to be uploaded on the local system.
+		:param remote_root: The path where the file will be uploaded on the server. Default is "/" (root directory).
+		:param exists: The action to be taken if the file already exists on the server. Can be either 'UploadMode.OVERWRITE.value' or 'UploadMode.SKIP.value'. Default is 'UploadMode.SKIP.value'.
+		:param part_size: The size of each part in bytes. Default is 8 MB. Files not larger than one part are uploaded with a single request.
+		:param max_workers: The maximum number of parts uploaded concurrently. Default is 8.
+		:param cookies: The cookies to use for authentication. If not provided, the instance's cookies will be used.
+
+		:returns: The HTTP responses from the server, one per part in file order. Empty if the file was skipped.
+
+		Raises:
+
+		- FileNotFoundError: If the specified file does not exist on the local system.
+		- IsADirectoryError: If the specified path is a directory.
+		- ValueError: If the 'exists' parameter is not 'UploadMode.OVERWRITE.value' or 'UploadMode.SKIP.value'.
+		- AuthorizationFailed: If the server denies access.
+		- APIError: If the uploaded file's size on the server doesn't match the local file, e.g. when the server ignores `Content-Range`.
+		"""
 
 		if not os.path.exists(local_path):
 			raise FileNotFoundError(f"file \"{local_path}\" does not exist")
@@ -444,59 +1060,72 @@ class HFS:
 		if exists not in (UploadMode.OVERWRITE.value, UploadMode.SKIP.value):
 			raise ValueError("\"exists\" param should be 'UploadMode.OVERWRITE.value' or 'UploadMode.SKIP.value'")
 
-		# url = f"https://{self.domain}/{os.path.join(remote_root, os.path.basename(local_path)).replace(os.sep, '/')}?existing={exists}"
+		if part_size < 1 or max_workers < 1:
+			raise ValueError("\"part_size\" and \"max_workers\" params should be positive integers")
 
-		remote_root = remote_root.removeprefix('/')
+		file_size = os.path.getsize(local_path)
 
-		print(f"{str(exists)}")
+		if file_size <= part_size:
+			return self._upload_file(local_path, remote_root, exists=exists, cookies=cookies),
 
-		url = os.path.join(f"https://{self.domain}", remote_root, os.path.basename(local_path)).replace(os.sep, '/') + f"?existing={str(exists)}"
+		remote_root = remote_root.removeprefix('/')
+		remote_file = f"/{remote_root}/{os.path.basename(local_path)}"
 
-		file_size = os.path.getsize(local_path)
+		# every part after the first one finds the file existing, so skipping is decided once, up front
+		if exists == UploadMode.SKIP.value and self.exists(remote_file, cookies=cookies):
+			return ()
 
-		file_size_threshold = 1024 * 1024  # 1 MB
+		url = self._upload_url(local_path, remote_root, UploadMode.OVERWRITE.value)
 
-		# plz dont take out `response = requests.put...` of conditional operator.
-		# `MultipartEncoder` reads file dynamically, so request should be inside `with tqdm` block
-		with open(local_path, 'rb') as f:
-			if file_size < file_size_threshold:
-				response = requests.put(
+		# bounds the number of queued parts, so they don't exhaust the connection pool
+		in_flight = threading.BoundedSemaphore(max_workers * 2)
+
+		def put_part(mm: mmap.mmap, offset: int) -> requests.Response:
+			try:
+				end = min(offset + part_size, file_size)
+				return self._session.put(
 					url,
 					cookies=cookies,
-					data=f.read()
+					headers={"Content-Range": f"bytes {offset}-{end - 1}/{file_size}"},
+					data=mm[offset:end]
 				)
-			else:
-				# thx Glen Thompson (https://stackoverflow.com/a/67726532/16815310)
-				with tqdm(
-						desc=os.path.basename(local_path),
-						total=file_size,
-						unit="B",
-						unit_scale=True,
-						unit_divisor=1024,
-				) as bar:
-					fields = {"file": ("filename", f)}
-					e = MultipartEncoder(fields=fields)
-					data = MultipartEncoderMonitor(
-						e, lambda monitor: bar.update(monitor.bytes_read - bar.n)
-					)
-
-					response = requests.put(
-						url,
-						cookies=cookies,
-						data=data
-					)
+			finally:
+				in_flight.release()
 
-		match response.status_code:
-			case 401:  # 401 Unauthorized
-				raise AuthorizationFailed("Access denied")
+		# the file is mapped rather than read, so a part is only copied into memory right before it is sent
+		with (open(local_path, 'rb') as f,
+		      mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+		      ThreadPoolExecutor(max_workers=max_workers) as executor):
+			futures = []
+			for offset in range(0, file_size, part_size):
+				in_flight.acquire()
+				futures.append(executor.submit(put_part, mm, offset))
 
-		return response
+			responses = tuple(future.result() for future in futures)
+
+		self.invalidate_path(remote_file)
+
+		for response in responses:
+			match response.status_code:
+				case 401:  # 401 Unauthorized
+					raise AuthorizationFailed("Access denied")
+
+		# a server without `Content-Range` support stores each part as the whole file, which only shows in the final size
+		name = os.path.basename(local_path)
+		remote_size = next((hfs_path.size for hfs_path in self.list(f"/{remote_root}", cookies=cookies) if hfs_path.name == name), None)
+		if remote_size != file_size:
+			raise APIError(f"uploaded \"{name}\" has {remote_size} bytes on the server instead of {file_size}")
+
+		return responses
 
 	def _upload_folder(self,
 	                   local_path: str,
 	                   remote_path: str = "/",
 	                   *,
 	                   exists: Literal[UploadMode.OVERWRITE.value, UploadMode.SKIP.value] = UploadMode.SKIP.value,
+	                   max_workers: int = 8,
+	                   multipart: bool = False,
+	                   use_asyncio: bool = False,
 	                   cookies: dict | requests.cookies.RequestsCookieJar = None):
 
 		"""
@@ -505,6 +1134,9 @@ class HFS:
 	    :param local_path: The path of the folder to be uploaded on the local system.
 	    :param remote_path: The path where the folder will be uploaded on the server. Default is "/" (root directory).
 	    :param exists: The action to be taken if the folder already exists on the server. Can be either 'UploadMode.OVERWRITE.value' or 'UploadMode.SKIP.value'. Default is 'UploadMode.SKIP.value'.
+	    :param max_workers: The maximum number of files uploaded concurrently. Default is 8.
+	    :param multipart: If True, files larger than 1 MB are sent as `multipart/form-data` instead of a raw body, for servers that require it. Default is False.
+	    :param use_asyncio: If True, files are uploaded from a single `asyncio` event loop with `aiohttp` instead of a thread pool; `max_workers` then limits concurrent uploads. Requires `aiohttp`. `multipart` is not supported in this mode. Default is False.
 	    :param cookies: The cookies to use for authentication. If not provided, the instance's cookies will be used.
 
 	    :returns: None. The function prints the HTTP response from the server for each file uploaded.
@@ -517,35 +1149,159 @@ class HFS:
 	    - AuthorizationFailed: If the server denies access.
 	    """
 
-		if cookies is None:
-			cookies = self.__cookies
-
 		if not os.path.exists(local_path):
 			raise FileNotFoundError(f"folder \"{local_path}\" does not exist")
 
 		if not os.path.isdir(local_path):
 			raise NotADirectoryError("path \"{path}\" is not a directory")
 
-		remote_root = os.path.join(remote_path, os.path.normpath(local_path).split(os.sep)[-1]).replace(os.sep, "/")
+		if max_workers < 1:
+			raise ValueError("\"max_workers\" param should be a positive integer")
+
+		if use_asyncio:
+			try:
+				import aiohttp  # noqa, imported again by `_upload_files_async`, this only checks it is installed
+			except ImportError:
+				raise ImportError("\"use_asyncio\" param requires aiohttp to be installed") from None
+
+		# walked paths are already '/'-separated, so remote paths are built with `posixpath` and need no separator replacing
+		local_root = os.path.normpath(local_path).replace(os.sep, '/')
+		remote_root = posixpath.join(remote_path.replace(os.sep, '/'), posixpath.basename(local_root))
+
+		uploads: list[tuple[str, os.DirEntry, str]] = []
+		remote_files: list[str] = []
+		for local_file, relative_file, entry in _local_walk_gen(local_path):
+			remote_file = posixpath.normpath(posixpath.join(remote_root, relative_file))
+
+			uploads.append((local_file, entry, posixpath.dirname(remote_file)))
+			remote_files.append(remote_file)
+
+		# ancestors are checked in the same request, so missing folders can be created level by level without further checks
+		remote_dirs = set()
+		for _, _, remote_dir in uploads:
+			while remote_dir.strip('/') and remote_dir not in remote_dirs:
+				remote_dirs.add(remote_dir)
+				remote_dir = posixpath.dirname(remote_dir)
+
+		remote_dirs = sorted(remote_dirs, key=lambda remote_dir: remote_dir.count('/'))  # parents first
+		existing = {remote_dir: True for remote_dir in remote_dirs if _dir_key(remote_dir) in self._known_dirs}
+		existing |= self.exists_many([remote_dir for remote_dir in remote_dirs if remote_dir not in existing], cookies=cookies)
+		self._remember_dirs(remote_dir for remote_dir, exists in existing.items() if exists)
+
+		# files already on the server are dropped here with one request, instead of sending each of them for the server to skip.
+		# only folders that existed before can contain such files
+		if exists == UploadMode.SKIP.value:
+			present = self.exists_many(
+				[remote_file for remote_file, (_, _, remote_dir) in zip(remote_files, uploads) if existing.get(remote_dir, True)],  # the root isn't checked, it always exists
+				cookies=cookies
+			)
+			uploads = [upload for remote_file, upload in zip(remote_files, uploads) if not present.get(remote_file, False)]
+
+		# folders are created up front, so concurrent uploads don't race on them
+		for remote_dir in remote_dirs:
+			if not existing[remote_dir]:
+				parent, name = posixpath.split(remote_dir)
+				resp = self._create_folder_one(name, root=parent or "/", cookies=cookies)
+				logger.debug("create folder %s: %s %s", remote_dir, resp.status_code, resp.text)
+
+		if use_asyncio:
+			import asyncio  # only needed here, importing it with the package slows down every import
+
+			for status_code, text in asyncio.run(self._upload_files_async(uploads, exists=exists, max_workers=max_workers, cookies=cookies)):
+				print(colorize_status_code(status_code), text)
+			return
+
+		# bounds the number of queued tasks, so huge trees don't sit in the executor queue all at once
+		in_flight = threading.BoundedSemaphore(max_workers * 2)
+		failed = threading.Event()
+
+		def on_done(future):
+			in_flight.release()
+			if not future.cancelled() and future.exception() is not None:
+				failed.set()
+
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			futures = []
+			try:
+				for local_file, entry, remote_dir in uploads:
+					in_flight.acquire()
+					if failed.is_set():  # the error is raised by `as_completed` below, no point in starting more uploads
+						break
+
+					future = executor.submit(self._upload_file, local_file, remote_dir, exists=exists, entry=entry, multipart=multipart, cookies=cookies)
+					future.add_done_callback(on_done)
+					futures.append(future)
+
+				for future in as_completed(futures):
+					resp = future.result()
+					print(colorize_status_code(resp.status_code), resp.text)
+			except BaseException:
+				# queued uploads are dropped, so an error or Ctrl+C doesn't wait for the whole tree
+				executor.shutdown(wait=False, cancel_futures=True)
+				raise
+
+	async def _upload_files_async(self,
+	                              uploads: "Iterable[tuple[str, os.DirEntry, str]]",
+	                              *,
+	                              exists: Literal[UploadMode.OVERWRITE.value, UploadMode.SKIP.value],
+	                              max_workers: int,
+	                              cookies: dict | requests.cookies.RequestsCookieJar = None) -> "tuple[tuple[int, str], ...]":
+
+		"""
+		Uploads `(local_file, entry, remote_dir)` triples from a single event loop, at most `max_workers` at a time.
+
+		:returns: The status code and text of the server response for each file, in the order of `uploads`.
+		"""
+		import asyncio
+		import aiohttp
+
+		semaphore = asyncio.Semaphore(max_workers)
+		connector = aiohttp.TCPConnector(limit=max_workers, keepalive_timeout=30, ssl=self._session.verify is not False)
 
-		threads: list[threading.Thread] = []
-		for local_file in _local_walk_gen(local_path):
-			remote_file = os.path.normpath(os.path.join(remote_root, os.path.relpath(local_file, local_path))).replace(os.sep, '/')
+		async with aiohttp.ClientSession(cookies=self.get_cookies() if cookies is None else dict(cookies), connector=connector) as session:
+			async def upload_one(local_file: str, remote_dir: str) -> tuple[int, str]:
+				async with semaphore:
+					return await self._upload_file_async(session, local_file, remote_dir, exists=exists)
 
-			print(remote_file)
-			if not self.exists(os.path.dirname(remote_file), cookies=cookies):
-				self.create_folder(os.path.dirname(remote_file), cookies)
-			resp = self._upload_file(local_file, os.path.dirname(remote_file), exists=exists, cookies=cookies)
+			return tuple(await asyncio.gather(*(upload_one(local_file, remote_dir) for local_file, _, remote_dir in uploads)))
+
+	async def _upload_file_async(self,
+	                             session: "aiohttp.ClientSession",
+	                             local_path: str,
+	                             remote_root: str,
+	                             *,
+	                             exists: Literal[UploadMode.OVERWRITE.value, UploadMode.SKIP.value]) -> tuple[int, str]:
+
+		"""
+		`aiohttp` counterpart of `_upload_file`, the file is streamed as a raw body.
+
+		:returns: The status code and text of the server response.
+
+		Raises:
+
+		- AuthorizationFailed: If the server denies access.
+		"""
+
+		with open(local_path, 'rb') as f:
+			async with session.put(self._upload_url(local_path, remote_root, exists), data=f) as response:
+				text = await response.text()
+
+		match response.status:
+			case 401:  # 401 Unauthorized
+				raise AuthorizationFailed("Access denied")
 
-			print(colorize_status_code(resp.status_code), resp.text)
+		self.invalidate_path(f"/{remote_root.removeprefix('/')}/{os.path.basename(local_path)}")
 
-	# threads.append(threading.Thread())
+		return response.status, text
 
 	def upload(self,
 	           local_path: str,
 	           remote_path: str = "",
 	           *,
 	           exists: Literal[UploadMode.OVERWRITE.value, UploadMode.SKIP.value] = UploadMode.SKIP.value,
+	           max_workers: int = 8,
+	           multipart: bool = False,
+	           use_asyncio: bool = False,
 	           cookies: dict | requests.cookies.RequestsCookieJar = None):
 
 		"""
@@ -554,6 +1310,9 @@ class HFS:
 		:param local_path: The path of the file or folder to be uploaded on the local system.
 		:param remote_path: The path where the file or folder will be uploaded on the server. Default is "/" (root directory).
 		:param exists: The action to be taken if the file or folder already exists on the server. Can be either 'UploadMode.OVERWRITE.value' or 'UploadMode.SKIP.value'. Default is 'UploadMode.SKIP.value'.
+		:param max_workers: The maximum number of files uploaded concurrently when uploading a folder. Default is 8.
+		:param multipart: If True, files larger than 1 MB are sent as `multipart/form-data` instead of a raw body, for servers that require it. Default is False.
+		:param use_asyncio: If True, the files of a folder are uploaded from a single `asyncio` event loop with `aiohttp` instead of a thread pool. Requires `aiohttp`. Default is False.
 		:param cookies: The cookies to use for authentication. If not provided, the instance's cookies will be used.
 
 		:returns: None. The function prints the HTTP response from the server for each file uploaded.
@@ -570,6 +1329,6 @@ class HFS:
 			raise FileNotFoundError(f"file \"{local_path}\" does not exist")
 
 		if os.path.isfile(local_path):
-			return self._upload_file(local_path, remote_path, exists=exists, cookies=cookies)
+			return self._upload_file(local_path, remote_path, exists=exists, multipart=multipart, cookies=cookies)
 		else:
-			return self._upload_folder(local_path, remote_path, exists=exists, cookies=cookies)
+			return self._upload_folder(local_path, remote_path, exists=exists, max_workers=max_workers, multipart=multipart, use_asyncio=use_asyncio, cookies=cookies)
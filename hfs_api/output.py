@@ -1,12 +1,42 @@
 import colorama
+import functools
 import http.client
+import os
+import sys
+from datetime import datetime
 
 from .HFSPath import HFSPath
 
-colorama.init(autoreset=True)
+# ANSI codes are written as is and reset explicitly. `colorama.init` would wrap `sys.stdout` and scan every write,
+# `just_fix_windows_console` only turns on ANSI support of the Windows console, and does nothing elsewhere.
+# it was added in colorama 0.4.6, older versions still need the wrapper
+if hasattr(colorama, "just_fix_windows_console"):
+	colorama.just_fix_windows_console()
+else:
+	colorama.init()
 Fore = colorama.Fore
 
 
+# color of each status code class, e.g. 4 for 4xx
+_CLASS_COLORS: dict[int, str] = {
+	2: Fore.LIGHTGREEN_EX,
+	3: Fore.CYAN,
+	4: Fore.LIGHTRED_EX,
+	5: Fore.LIGHTRED_EX,
+}
+
+
+def _colorize(text: str, color: str | None) -> str:
+	return text if color is None else f"{color}{text}{Fore.RESET}"
+
+
+# built once, so colorizing a known status code is a single dict lookup
+_STATUS_TABLE: dict[int, str] = {
+	status_code: _colorize(f"{status_code} {reason}", _CLASS_COLORS.get(status_code // 100))
+	for status_code, reason in http.client.responses.items()
+}
+
+
 def colorize_status_code(status_code: int) -> str:
 	"""
 	This function takes an HTTP status code as input and returns a string with the status code
@@ -15,23 +45,33 @@ def colorize_status_code(status_code: int) -> str:
 	- Status codes in the range 200-299 are colored green.
 	- Status codes in the range 300-399 are colored cyan.
 	- Status codes in the range 400-599 are colored red.
-	- For status codes outside these ranges, a ValueError is raised.
+	- Status codes outside these ranges are left uncolored.
+
+	Status codes without a standard reason phrase, e.g. custom ones, are returned without it.
 
 	:param status_code: The HTTP status code to be colored.
 
 	:returns: A string containing the colored status code and its corresponding HTTP response message.
 	"""
 
-	if status_code in range(200, 300):
-		color = Fore.LIGHTGREEN_EX
-	elif status_code in range(300, 400):
-		color = Fore.CYAN
-	elif status_code in range(400, 600):
-		color = Fore.LIGHTRED_EX
-	else:
-		raise ValueError
+	try:
+		return _STATUS_TABLE[status_code]
+	except KeyError:
+		return _colorize_unknown(status_code)
+
 
-	return f"{color}{status_code} {http.client.responses[status_code]}"
+@functools.lru_cache(maxsize=32)
+def _colorize_unknown(status_code: int) -> str:
+	# codes missing from `_STATUS_TABLE` are rare, but a server using one tends to repeat it, so they are memoized too
+	return _colorize(str(status_code), _CLASS_COLORS.get(status_code // 100))
+
+
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def _format_mtime(modified_at: datetime) -> str:
+	# same as `modified_at.strftime("%b %d %H:%M")` in the C locale, without a libc `strftime` call per row
+	return f"{_MONTHS[modified_at.month - 1]} {modified_at.day:02d} {modified_at.hour:02d}:{modified_at.minute:02d}"
 
 
 def ls(hfs_file: list[HFSPath]):
@@ -45,20 +85,35 @@ def ls(hfs_file: list[HFSPath]):
 	:returns: None. The function prints the contents of the HFS paths to the console.
 	:rtype: None
 	"""
-	dirs = [path for path in hfs_file if path.is_directory]
-	files = [path for path in hfs_file if not path.is_directory]
-
-	for path in dirs:
-		modified_at = path.modified_at.strftime("%b %d %H:%M")
-		name = path.name
-		comment = path.comment
-
-		print(f"{modified_at}          {name}{'  # ' + comment if comment else ''}")
-
-	for path in files:
-		modified_at = path.modified_at.strftime("%b %d %H:%M")
-		name = path.name
-		comment = path.comment
-		size = path.size
-
-		print(f"{modified_at} {size:>8} {name}{'  # ' + comment if comment else ''}")
+	# one pass splits the paths, directories are listed first
+	dirs, files = [], []
+	for path in hfs_file:
+		(dirs if path.is_directory else files).append(path)
+
+	# rows are joined and written at once, instead of a `print` (and a flush) per row
+	lines = [
+		f"{_format_mtime(path.modified_at)}          {path.name}{'  # ' + comment if (comment := path.comment) else ''}"
+		for path in dirs
+	]
+	lines += [
+		f"{_format_mtime(path.modified_at)} {path.size:>8} {path.name}{'  # ' + comment if (comment := path.comment) else ''}"
+		for path in files
+	]
+
+	if not lines:
+		return
+
+	text = "\n".join(lines) + "\n"
+
+	# on a POSIX terminal the rows skip the text layer of `sys.stdout` and go to its file descriptor directly.
+	# redirected output keeps going through `sys.stdout`, since whatever replaced it may expect text; so does the Windows console,
+	# which decodes raw writes with the ANSI code page
+	if sys.platform != "win32" and sys.stdout.isatty():
+		sys.stdout.flush()  # output buffered before stays before the rows
+
+		data = memoryview(text.encode(sys.stdout.encoding or "utf-8", errors="replace"))
+		fd = sys.stdout.fileno()
+		while data:
+			data = data[os.write(fd, data):]
+	else:
+		sys.stdout.write(text)
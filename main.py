@@ -1,17 +1,23 @@
-import code
 import sys
 from typing import Final
 import os
-import shlex
+import re
+import functools
+import glob
+from concurrent.futures import ThreadPoolExecutor
 import colorama
 import signal
-from rich.traceback import install
 
 from hfs_api import HFS, UploadMode
 from hfs_api.output import colorize_status_code, ls
 
-install(show_locals=True, width=300)
-colorama.init(autoreset=True)
+# rich tracebacks are opt-in: importing rich delays the first prompt, and formatting locals of every frame makes errors slow
+if os.environ.get("HFS_RICH_TB"):
+	from rich.traceback import install
+
+	install(show_locals=False, width=120)
+
+# the console is set up for ANSI colors by `hfs_api.output`
 Fore = colorama.Fore
 
 domain: Final[str] = os.environ["DOMAIN"]
@@ -20,113 +26,241 @@ hfs = HFS(domain)
 hfs.authorize("admin", os.environ["ADMIN_PASSWORD"])
 print(hfs.get_cookies())
 
-signal.signal(signal.SIGINT, lambda _s, _f: (print(f"\n{Fore.LIGHTRED_EX}[E] KeyboardInterrupt"), sys.exit(0)))
+def _on_sigint(_signum, _frame):
+	print(f"\n{Fore.LIGHTRED_EX}[E] KeyboardInterrupt{Fore.RESET}")
+	sys.stdout.flush()
+	# `sys.exit` would wait for uploads running on `_POOL` workers to finish, the process is ended right away instead
+	os._exit(0)
 
-N = 10
 
+signal.signal(signal.SIGINT, _on_sigint)
+
+# a token is a run of plain characters and quoted parts, e.g. `a"b c"'d'`. lines this doesn't cover, i.e. with backslash
+# escapes or unbalanced quotes, are left to `shlex`. only the characters `shlex` splits on separate tokens,
+# not every `\s` (e.g. a non-breaking space stays part of a file name)
+_TOKEN = r"""(?:[^ \t\r\n"'\\]|"[^"\\]*"|'[^']*')+"""
+_LINE = re.compile(rf"[ \t\r\n]*(?:{_TOKEN}(?:[ \t\r\n]+|\Z))*")
+_TOKENS = re.compile(_TOKEN)
+_QUOTED = re.compile(r""""([^"\\]*)"|'([^']*)'""")
+
+
+def _split(line: str) -> list[str]:
+	"""
+	Splits a command line like `shlex.split`, but with precompiled regexes for the usual lines instead of `shlex`'s pure-Python lexer.
+	"""
+	if _LINE.fullmatch(line) is None:
+		import shlex  # only needed for the rare lines the regexes don't cover
+
+		return shlex.split(line)
+
+	return [_QUOTED.sub(lambda match: match[1] if match[1] is not None else match[2], token) for token in _TOKENS.findall(line)]
+
+
+@functools.lru_cache(maxsize=256)
+def _norm(path: str) -> str:
+	"""
+	Normalizes a path typed in the REPL into a '/'-separated one, e.g. "a\\..\\b" -> "b" on Windows.
+	"""
+	path = os.path.normpath(path)
+	return path if os.sep == '/' else path.replace(os.sep, '/')
+
+
+def _rooted(path: str) -> str:
+	"""
+	Normalizes a path typed in the REPL into a server path with a single leading slash, e.g. "a/b" and "/a/b" -> "/a/b".
+	"""
+	return '/' + _norm(path).lstrip('/')
+
+
+# files matched by an upload glob are sent concurrently, files inside each folder are already parallelized by `HFS.upload`
+_POOL = ThreadPoolExecutor(max_workers=4)
+
+_EXISTS_TRUE: Final[str] = f"{Fore.LIGHTGREEN_EX}True{Fore.RESET}"
+_EXISTS_FALSE: Final[str] = f"{Fore.LIGHTRED_EX}False{Fore.RESET}"
+
+_CLS: Final[str] = "\x1b[H\x1b[2J"  # cursor home + erase screen
+
+_UPLOAD_MODES: Final[dict[str, str]] = {
+	"skip": UploadMode.SKIP.value,
+	"overwrite": UploadMode.OVERWRITE.value
+}
+
+
+def _enough_args(raw_input: list[str], count: int) -> bool:
+	"""
+	Checks that the command in `raw_input` got at least `count` arguments, and reports it if not.
+	"""
+	if len(raw_input) > count:
+		return True
+
+	print(Fore.LIGHTRED_EX + "[E] Not enough arguments" + Fore.RESET)
+	return False
+
+
+def _cmd_upload(raw_input: list[str]):
+	if not _enough_args(raw_input, 2):
+		return
+
+	local_path = raw_input[1]
+	remote_path = raw_input[2]
+
+	exists = UploadMode.SKIP.value
+	if len(raw_input) > 3:
+		exists = _UPLOAD_MODES.get(raw_input[3])
+		if exists is None:
+			print(Fore.LIGHTRED_EX + "[E] Invalid 'exists' value" + Fore.RESET)
+			return
+
+	# an existing path is taken literally, so names like "photo[1].jpg" aren't read as patterns.
+	# a path that matches nothing is passed on as is, so `upload` reports it
+	local_paths = [local_path] if os.path.exists(local_path) else glob.glob(local_path) or [local_path]
+
+	# several matched files are sent concurrently. folders are uploaded one by one on this thread, they parallelize their files themselves
+	files = [path for path in local_paths if os.path.isfile(path)]
+	folders = [path for path in local_paths if not os.path.isfile(path)]
+
+	def upload(path: str):
+		return hfs.upload(path, remote_path, exists=exists)
+
+	for resp in (_POOL.map(upload, files) if len(files) > 1 else map(upload, files)):
+		print(colorize_status_code(resp.status_code), resp.text)
+
+	for path in folders:
+		upload(path)  # folder uploads print their own responses
+
+
+def _cmd_mkdir(raw_input: list[str]):
+	if not _enough_args(raw_input, 1):
+		return
+
+	root, name = _rooted(raw_input[1]).rsplit('/', 1)
+	resp = hfs._create_folder_one(name, root=root or '/')
+	print(colorize_status_code(resp.status_code), resp.text)
+
+
+def _cmd_ls(raw_input: list[str]):
+	if not _enough_args(raw_input, 1):
+		return
+
+	ls_path = raw_input[2] if len(raw_input) > 2 else '/'
+	match raw_input[1]:
+		case "local":
+			raise NotImplementedError
+		case "remote":
+			ls(hfs.list(ls_path))
+
+
+def _cmd_exists(raw_input: list[str]):
+	if not _enough_args(raw_input, 1):
+		return
+
+	# any number of paths is checked with a single request
+	paths = [_rooted(name) for name in raw_input[1:]]
+	results = hfs.exists_many(paths)
+
+	if len(paths) == 1:
+		print(_EXISTS_TRUE if results[paths[0]] else _EXISTS_FALSE)
+	else:
+		print("\n".join(f"{_EXISTS_TRUE if results[path] else _EXISTS_FALSE} {path}" for path in paths))
+
+
+def _cmd_delete(raw_input: list[str]):
+	if not _enough_args(raw_input, 1):
+		return
+
+	resp = hfs.delete(_rooted(raw_input[1]))
+	print(colorize_status_code(resp.status_code), resp.text)
+
+
+def _cmd_move(raw_input: list[str]):
+	if not _enough_args(raw_input, 2):
+		return
+
+	resp = hfs.move(_norm(raw_input[1]), _norm(raw_input[2]))
+	print(colorize_status_code(resp.status_code), resp.text)
+
+
+def _cmd_copy(raw_input: list[str]):
+	raise NotImplementedError
+
+
+def _cmd_rename(raw_input: list[str]):
+	if not _enough_args(raw_input, 2):
+		return
+
+	resp = hfs.rename(_rooted(raw_input[1]), raw_input[2])
+	print(colorize_status_code(resp.status_code), resp.text)
+
+
+def _cmd_console(raw_input: list[str]):
+	import code  # imported on first use, it is only needed here and slows down startup
+
+	code.interact(local=dict(globals()), banner=f"{Fore.YELLOW}Python HFS Shell{Fore.RESET}", exitmsg=f"{Fore.YELLOW}Exiting, goodbye...{Fore.RESET}")
+
+
+def _cmd_quit(raw_input: list[str]) -> bool:
+	return True  # stops `mainloop`
+
+
+def _cmd_clear(raw_input: list[str]):
+	sys.stdout.write(_CLS)
+	sys.stdout.flush()
+
+
+def _cmd_unknown(raw_input: list[str]):
+	print(Fore.LIGHTRED_EX + "[E] Unknown command" + Fore.RESET)
+
+
+# every alias of a command maps to its handler, so a command is found with one dict lookup.
+# a handler gets the whole tokenized line and returns True to leave the REPL
+_DISPATCH: Final[dict] = {
+	alias: handler
+	for aliases, handler in (
+		(("upload",), _cmd_upload),
+		(("mkdir",), _cmd_mkdir),
+		(("ls", "dir"), _cmd_ls),
+		(("exist", "exists", "is"), _cmd_exists),
+		(("delete", "del", "remove", "rem", "rm"), _cmd_delete),
+		(("move", "mv"), _cmd_move),
+		(("copy", "cp"), _cmd_copy),
+		(("rename",), _cmd_rename),
+		(("console", "inter", "shell"), _cmd_console),
+		(("quit", "exit", "q"), _cmd_quit),
+		(("clear", "cls"), _cmd_clear),
+	)
+	for alias in aliases
+}
+
+
+def _read_lines():
+	"""
+	Yields the command lines typed at the prompt, or, when stdin is not a terminal (e.g. `main.py < script.txt`),
+	the lines of the whole input read at once, without prompting for each.
+	"""
+	if not sys.stdin.isatty():
+		yield from sys.stdin.read().splitlines()
+		return
 
-def mainloop():
 	while True:
 		try:
-			raw_input = shlex.split(input(f"{Fore.LIGHTBLUE_EX}>> "))
+			line = input(f"{Fore.LIGHTBLUE_EX}>> {Fore.RESET}")
 		except (EOFError, UnicodeError):
-			print(f"{Fore.LIGHTRED_EX}[E] EOF Error")
+			print(f"{Fore.LIGHTRED_EX}[E] EOF Error{Fore.RESET}")
 			sys.exit(0)
 		print(Fore.RESET)
 
+		yield line
+
+
+def mainloop():
+	for line in _read_lines():
+		raw_input = _split(line)
+
 		if not raw_input:  # empty input
 			continue
 
-		raw_input.extend([''] * (N - len(raw_input)))
-
-		command = raw_input[0]
-
-		match command:
-			case "upload":
-				local_path = raw_input[1]
-				remote_path = raw_input[2]
-
-				if '' in (local_path, remote_path):
-					print(Fore.LIGHTRED_EX + "[E] Not enough arguments")
-					continue
-
-				exists = UploadMode.SKIP.value
-				if len(raw_input) == 4:
-					match raw_input[3]:
-						case "skip":
-							exists = UploadMode.SKIP.value
-						case "overwrite":
-							exists = UploadMode.OVERWRITE.value
-						case _:
-							print(Fore.LIGHTRED_EX + "[E] Invalid 'exists' value")
-							continue
-					exists = {
-						"skip": UploadMode.SKIP.value,
-						"overwrite": UploadMode.OVERWRITE.value
-					}.get(raw_input[3], UploadMode.SKIP.value)
-
-				normpath = os.path.normpath(local_path).replace(os.sep, '/')
-				hfs.upload(local_path, remote_path, exists=exists)
-
-			case "mkdir":
-				name = raw_input[1]
-				normpath = os.path.normpath(name).split(os.sep)
-				resp = hfs._create_folder_one(normpath[-1], root='/' + '/'.join(normpath[:-1]))
-				print(colorize_status_code(resp.status_code), resp.text)
-
-			case "ls" | "dir":
-				comp = raw_input[1]
-
-				ls_path = '/'
-				if len(raw_input) == 3:
-					ls_path = raw_input[2]
-				match comp:
-					case "local":
-						raise NotImplementedError
-					case "remote":
-						ls(hfs.list(ls_path))
-
-			case "exist" | "exists" | "is":
-				name = raw_input[1]
-				normpath = '/' + os.path.normpath(name).replace(os.sep, '/')
-				resp = hfs.exists(normpath)
-				print((Fore.LIGHTGREEN_EX if resp else Fore.LIGHTRED_EX) + str(resp))
-
-			case "delete" | "del" | "remove" | "rem" | "rm":
-				name = raw_input[1]
-				normpath = '/' + os.path.normpath(name).replace(os.sep, '/')
-				resp = hfs.delete(normpath)
-				print(colorize_status_code(resp.status_code), resp.text)
-
-			case "move" | "mv":
-				old_path = raw_input[1]
-				new_path = raw_input[2]
-				old_path = os.path.normpath(old_path).replace(os.sep, '/')
-				new_path = os.path.normpath(new_path).replace(os.sep, '/')
-				resp = hfs.move(old_path, new_path)
-				print(colorize_status_code(resp.status_code), resp.text)
-
-			case "copy" | "cp":
-				raise NotImplementedError
-
-			case "rename":
-				old_name = raw_input[1]
-				new_name = raw_input[2]
-				normpath = '/' + os.path.normpath(old_name).replace(os.sep, '/')
-				resp = hfs.rename(old_name, new_name)
-				print(colorize_status_code(resp.status_code), resp.text)
-
-			case "console" | "inter" | "shell":
-				code.interact(local=locals(), banner=f"{Fore.YELLOW}Python HFS Shell", exitmsg=f"{Fore.YELLOW}Exiting, goodbye...")
-
-			case "quit" | "exit" | "q":
-				return
-
-			case "clear" | "cls":
-				print("\33c")
-
-			case _:
-				print(Fore.LIGHTRED_EX + "[E] Unknown command")
+		if _DISPATCH.get(raw_input[0], _cmd_unknown)(raw_input):
+			return
 
 
 # hfs.upload_file(r"D:\media\что-то умное\Книги по астре\ОБЩАЯ АСТРОНОМИЯ\Кононович Э.В., Мороз В.И. - Общий курс астрономии, 4-е изд. (2011).pdf", '/')